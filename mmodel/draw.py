@@ -26,6 +26,55 @@ def update_settings(label: str):
     return new_settings
 
 
+# the quoting helpers used by graphviz.Digraph, to generate identical source
+# these are private graphviz helpers and not part of the public API, check the
+# draw tests when the graphviz requirement changes
+_quote = graphviz.Digraph._quote
+_quote_edge = graphviz.Digraph._quote_edge
+_attr_list = graphviz.Digraph._attr_list
+
+
+def _dot_source(G, settings, node_labels=None, edge_labels=None):
+    """Build the DOT source of the graph
+
+    The source lines are collected in a list and joined once. The output
+    is the same as the source of the equivalent ``graphviz.Digraph``.
+
+    :param dict settings: graphviz graph settings, see ``update_settings``
+    :param dict node_labels: node labels, the nodes without label only
+        show the node name
+    :param dict edge_labels: edge xlabels, the edges without xlabel do not
+        have edge attributes
+    """
+
+    node_labels = node_labels or {}
+    edge_labels = edge_labels or {}
+
+    parts = [f"digraph {_quote(G.name)} {{\n" if G.name else "digraph {\n"]
+    for kw in ["graph", "node"]:
+        attrs = settings.get(f"{kw}_attr")
+        if attrs:
+            parts.append(f"\t{kw}{_attr_list(None, kwargs=attrs)}\n")
+
+    for node in G.nodes:
+        if node in node_labels:
+            attr = _attr_list(node_labels[node])
+        else:
+            attr = ""
+        parts.append(f"\t{_quote(node)}{attr}\n")
+
+    for u, v in G.edges:
+        if (u, v) in edge_labels:
+            attr = _attr_list(None, kwargs={"xlabel": edge_labels[u, v]})
+        else:
+            attr = ""
+        parts.append(f"\t{_quote_edge(u)} -> {_quote_edge(v)}{attr}\n")
+
+    parts.append("}\n")
+
+    return "".join(parts)
+
+
 def draw_plain_graph(G, label=""):
     """Draw plain graph
 
@@ -37,15 +86,8 @@ def draw_plain_graph(G, label=""):
     """
 
     settings = update_settings(label)
-    dot_graph = graphviz.Digraph(name=G.name, **settings)
-
-    for node in G.nodes:
-        dot_graph.node(node)
 
-    for u, v in G.edges:
-        dot_graph.edge(u, v)
-
-    return dot_graph
+    return graphviz.Source(_dot_source(G, settings))
 
 
 def draw_graph(G, label: str = ""):
@@ -59,26 +101,19 @@ def draw_graph(G, label: str = ""):
 
     settings = update_settings(label)
 
-    dot_graph = graphviz.Digraph(name=G.name, **settings)
-
+    node_labels = {}
     for node, ndict in G.nodes(data=True):
 
         if "func" in ndict:
-            label = (
+            node_labels[node] = (
                 f"{node}\l\n{ndict['func'].__name__}"
                 f"{ndict['sig']}\lreturn {', '.join(ndict['returns'])}\l"
             )
         else:
-            label = node
-        dot_graph.node(node, label=label)
+            node_labels[node] = node
 
+    edge_labels = {}
     for u, v, edict in G.edges(data=True):
+        edge_labels[u, v] = ", ".join(edict.get("val", []))
 
-        if "val" in edict:
-            xlabel = ", ".join(edict["val"])
-        else:
-            xlabel = ""
-
-        dot_graph.edge(u, v, xlabel=xlabel)
-
-    return dot_graph
+    return graphviz.Source(_dot_source(G, settings, node_labels, edge_labels))
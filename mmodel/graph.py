@@ -1,8 +1,7 @@
-import inspect
 import networkx as nx
 from mmodel.draw import draw_graph
-from copy import deepcopy
 from mmodel.modifier import signature_modifier
+from mmodel.utility import _cached_signature
 
 
 class ModelGraph(nx.DiGraph):
@@ -45,11 +44,11 @@ class ModelGraph(nx.DiGraph):
         for mdf, kwargs in modifiers:
             func = mdf(func, **kwargs)
 
-        sig = inspect.signature(func)
+        sig = _cached_signature(func)
         node_dict.update(
             {"func": func, "sig": sig, "returns": returns, "modifiers": modifiers}
         )
-        self.update_graph()
+        self.update_graph([node])
 
     def set_node_objects_from(self, node_objects: list):
         """Update the functions of existing nodes
@@ -65,13 +64,19 @@ class ModelGraph(nx.DiGraph):
         """Modify add_edge to update the edge attribute in the end"""
 
         super().add_edge(u_of_edge, v_of_edge, **attr)
-        self.update_graph()
+        self.update_edge(u_of_edge, v_of_edge)
 
     def add_edges_from(self, ebunch_to_add, **attr):
-        """Modify add_edges_from to update the edge attributes"""
+        """Modify add_edges_from to update the edge attributes
 
+        Only the added edges are updated.
+        """
+
+        # the ebunch can be an iterator, it is consumed twice
+        ebunch_to_add = list(ebunch_to_add)
         super().add_edges_from(ebunch_to_add, **attr)
-        self.update_graph()
+        for edge in ebunch_to_add:
+            self.update_edge(edge[0], edge[1])
 
     def add_grouped_edge(self, u, v):
         """Add linked edge
@@ -99,16 +104,30 @@ class ModelGraph(nx.DiGraph):
         for u, v in group_edges:
             self.add_grouped_edge(u, v)
 
-    def update_graph(self):
-        """Update edge attributes based on node objects and edges"""
+    def update_graph(self, nodes: list = None):
+        """Update edge attributes based on node objects and edges
 
-        for u, v in self.edges:
-            u_rts = set(self.nodes[u].get("returns", ()))
-            v_sig = self.nodes[v].get("sig", None)
+        If nodes are provided, only the edges adjacent to the nodes are updated.
+        Otherwise, all edges are updated.
+        """
+
+        if nodes is None:
+            edges = list(self.edges)
+        else:
+            edges = set(self.in_edges(nodes)) | set(self.out_edges(nodes))
+
+        for u, v in edges:
+            self.update_edge(u, v)
+
+    def update_edge(self, u, v):
+        """Update the edge variable attribute based on the node objects"""
 
-            if v_sig is not None:
-                v_params = set(v_sig.parameters.keys())
-                self.edges[u, v]["val"] = sorted(u_rts.intersection(v_params))
+        v_sig = self.nodes[v].get("sig", None)
+
+        if v_sig is not None:
+            u_rts = set(self.nodes[u].get("returns", ()))
+            # intersection iterates the parameter mapping, no set is created
+            self.edges[u, v]["val"] = sorted(u_rts.intersection(v_sig.parameters))
 
     def view_node(self, node: str):
         """view node information
@@ -155,17 +174,39 @@ class ModelGraph(nx.DiGraph):
         However, for subgraphs, deepcopy is incredibly inefficient because
         subgraph contains '_graph', which stores the original graph.
         An alternative method is to copy the code from the copy method,
-        but use deepcopy for the items.
+        but copy the items.
+
+        The attribute values are not deep copied. The callables and signatures
+        are treated as immutable and shared between the copies, only the
+        containers that graph operations modify (graph attribute dictionaries,
+        "returns", "modifiers" and "val" lists) are copied.
         """
-        # return deepcopy(self)
 
         G = self.__class__()
-        G.graph.update(deepcopy(self.graph))
-        G.add_nodes_from((n, deepcopy(d)) for n, d in self._node.items())
-        G.add_edges_from(
-            (u, v, deepcopy(datadict))
-            for u, nbrs in self._adj.items()
-            for v, datadict in nbrs.items()
+        G.graph.update(
+            {
+                key: value.copy() if isinstance(value, dict) else value
+                for key, value in self.graph.items()
+            }
+        )
+        G.add_nodes_from((n, _copy_attr(d)) for n, d in self._node.items())
+        # the edge values are copied, skip the edge attribute update
+        nx.DiGraph.add_edges_from(
+            G,
+            (
+                (u, v, _copy_attr(datadict))
+                for u, nbrs in self._adj.items()
+                for v, datadict in nbrs.items()
+            ),
         )
 
         return G
+
+
+def _copy_attr(attr_dict):
+    """Copy attribute dictionary, the list values are copied"""
+
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in attr_dict.items()
+    }
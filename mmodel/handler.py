@@ -1,7 +1,10 @@
-from collections import UserDict
+from collections import UserDict, OrderedDict
+from itertools import islice
 from mmodel.utility import model_signature, graph_topological_sort, param_counter
 from datetime import datetime
 import h5py
+import numpy as np
+import sys
 import string
 import random
 
@@ -18,6 +21,8 @@ class TopologicalHandler:
     """Base class for executing graph nodes in topological order"""
 
     DataClass = None
+    # delete the values of the compiled function after their last use
+    release_values = False
 
     def __init__(self, graph, returns: list = [], **datacls_kwargs):
 
@@ -27,9 +32,53 @@ class TopologicalHandler:
         self.graph = graph
         self.datacls_kwargs = datacls_kwargs
 
+        # the node objects are invariant between calls, store the execution
+        # plan as plain tuples of (func, parameters, returns, single return)
+        self._plan = {}
+        for node, attr in self.order:
+            params = tuple(attr["sig"].parameters)
+            self._plan[node] = (
+                self.node_callable(node, attr["func"]),
+                params,
+                tuple(attr["returns"]),
+                len(attr["returns"]) == 1,
+            )
+
+        self._run = self._compile() if self._is_compiled() else None
+
+    def __getstate__(self):
+        """The compiled function is local to the instance, it is not pickled"""
+
+        state = self.__dict__.copy()
+        state["_run"] = None
+        return state
+
+    def __setstate__(self, state):
+        """Compile the execution plan again after unpickling"""
+
+        self.__dict__.update(state)
+        self._run = self._compile() if self._is_compiled() else None
+
+    def _is_compiled(self):
+        """Whether the handler executes the compiled function
+
+        Dictionary data can be replaced by local variables of a compiled
+        function, other data classes and custom run_node or finish methods
+        use the generic loop.
+        """
+
+        return (
+            self.DataClass is dict
+            and type(self).run_node is TopologicalHandler.run_node
+            and type(self).finish is TopologicalHandler.finish
+        )
+
     def __call__(self, **kwargs):
         """Execute graph model by layer"""
 
+        if self._run is not None:
+            return self._run(kwargs)
+
         data = self.DataClass(kwargs, **self.datacls_kwargs)
 
         for node, node_attr in self.order:
@@ -42,29 +91,132 @@ class TopologicalHandler:
     def run_node(self, data, node, node_attr):
         """Run individual node"""
 
-        parameters = node_attr["sig"].parameters
-        kwargs = {key: data[key] for key in parameters}
+        func, params, returns, single = self._plan[node]
+        kwargs = {key: data[key] for key in params}
         try:
             # execute
-            func_output = node_attr["func"](**kwargs)
-            returns = node_attr["returns"]
-            if len(returns) == 1:
+            func_output = func(**kwargs)
+            if single:
                 data[returns[0]] = func_output
             else:
                 data.update(dict(zip(returns, func_output)))
         except:
-            try:  # if the data class need to be closed
-                data.close()
-            except:
-                pass
-
-            # format the error message
-            node_str = self.graph.view_node(node)
-            input_str = "\n".join(
-                [f"{key} = {repr(value)}" for key, value in kwargs.items()]
-            )
-            msg = ERROR_FORMAT.format(node=node, input_str=input_str, node_str=node_str)
-            raise Exception(msg)
+            self.raise_node_exception(data, node, kwargs)
+
+    def _compile(self):
+        """Compile the execution plan into a straight-line function
+
+        Each value is assigned to a local variable, and each node is executed
+        in a single line of the generated source::
+
+            def _run(kwargs):
+                v0 = kwargs['a']
+                ...
+                try:
+                    v2 = f0(a=v0, b=v1)
+                    v3, v4 = _islice(f1(c=v2), 2)
+                except:
+                    _fail(locals())
+                return (v3, v4)
+
+        Multiple returns take the leading outputs of the node, the same as
+        ``zip(returns, output)`` in ``run_node``. When a node fails, the line
+        number of the traceback is used to look up the node, and the node
+        inputs are recovered from the local variables.
+
+        If ``release_values`` is True, the local variables are deleted after
+        their last use (``del v2``), except for the returned values.
+        """
+
+        variables = {}  # value name: local variable name
+        header = []  # input values read from kwargs
+        calls = []  # node execution statements
+        last_use = {}  # local variable name: index of the last node that uses it
+
+        def var(key, read=True):
+            if key not in variables:
+                variables[key] = f"v{len(variables)}"
+                if read:
+                    header.append(f"        {variables[key]} = kwargs[{key!r}]")
+            return variables[key]
+
+        for index, (_, params, returns, _) in enumerate(self._plan.values()):
+            call = f"f{index}({', '.join(f'{key}={var(key)}' for key in params)})"
+            targets = [var(rt, read=False) for rt in returns]
+            if len(targets) > 1:
+                call = f"_islice({call}, {len(targets)})"
+            calls.append(f"{', '.join(targets)} = {call}" if targets else call)
+            for name in [variables[key] for key in params] + targets:
+                last_use[name] = index
+
+        return_vars = [var(rt) for rt in self.returns]
+        if len(return_vars) == 1:
+            return_line = f"        return {return_vars[0]}"
+        else:
+            return_line = f"        return ({', '.join(return_vars)})"
+
+        plan = list(self._plan.values())
+        funcs = [f"f{index}" for index in range(len(plan))]
+        lines = [
+            f"def _factory({', '.join(['_fail', '_islice'] + funcs)}):",
+            "    def _run(kwargs):",
+            *header,
+            "        try:",
+        ]
+        line_table = {}  # line number (starts at 1): node index
+        for index, call in enumerate(calls):
+            lines.append(f"            {call}")
+            line_table[len(lines)] = index
+
+            if self.release_values:
+                released = [
+                    name
+                    for name, last in last_use.items()
+                    if last == index and name not in return_vars
+                ]
+                if released:
+                    lines.append(f"            del {', '.join(released)}")
+
+        if not calls:
+            lines.append("            pass")
+        lines.extend(
+            [
+                "        except:",
+                "            _fail(locals())",
+                return_line,
+                "    return _run",
+            ]
+        )
+
+        def fail(local_dict):
+            index = line_table[sys.exc_info()[2].tb_lineno]
+            kwargs = {key: local_dict[variables[key]] for key in plan[index][1]}
+            self.raise_node_exception(None, self.order[index][0], kwargs)
+
+        namespace = {}
+        exec(compile("\n".join(lines), "<mmodel>", "exec"), namespace)
+        return namespace["_factory"](fail, islice, *(step[0] for step in plan))
+
+    def node_callable(self, node, func):
+        """The callable that executes the node, defaults to the node object"""
+
+        return func
+
+    def raise_node_exception(self, data, node, kwargs):
+        """Close the data object and raise exception with node information"""
+
+        try:  # if the data class need to be closed
+            data.close()
+        except:
+            pass
+
+        # format the error message
+        node_str = self.graph.view_node(node)
+        input_str = "\n".join(
+            [f"{key} = {repr(value)}" for key, value in kwargs.items()]
+        )
+        msg = ERROR_FORMAT.format(node=node, input_str=input_str, node_str=node_str)
+        raise Exception(msg)
 
     def finish(self, data, returns):
         """Finish execution"""
@@ -117,6 +269,8 @@ class H5Data:
     possibilities (picoseconds range).
     """
 
+    __slots__ = ("fname", "f", "gname", "group")
+
     def __init__(self, data, fname, gname):
 
         self.fname = fname
@@ -151,6 +305,21 @@ class H5Data:
         :param dict value_dict: dictionary of values to write
         :param h5py.group group: open h5py group object
         """
+
+        # common types with a native HDF5 equivalent are written directly,
+        # avoid raising exceptions
+        value_type = type(value)
+        if (
+            value_type in (float, bool, bytes, str)
+            or (value_type is int and -(2**63) <= value < 2**63)
+            or (
+                isinstance(value, (np.ndarray, np.generic))
+                and value.dtype.kind in "biufcS"
+            )
+        ):
+            self.group.create_dataset(key, data=value)
+            return
+
         try:
             self.group.create_dataset(key, data=value)
         except TypeError:
@@ -171,11 +340,15 @@ class BasicHandler(TopologicalHandler):
 class MemHandler(TopologicalHandler):
     """Memory optimized handler, delete intermediate values when necessary
 
-    The process works by keep a record of parameter counter. See MemData class
-    for more details.
+    The value usage is determined from the graph when the handler is
+    compiled. Each value is deleted after the last node that uses it, the
+    returned values are kept. Subclasses that override ``run_node`` or
+    ``finish`` use the generic loop, where the ``MemData`` class implements
+    the same behavior with a runtime counter.
     """
 
     DataClass = MemData
+    release_values = True
 
     def __init__(self, graph, returns: list = []):
         """Add counter to the object"""
@@ -184,11 +357,20 @@ class MemHandler(TopologicalHandler):
 
         super().__init__(graph, returns, counter=counter)
 
+    def _is_compiled(self):
+        """The compiled function replaces MemData for the default methods"""
+
+        return (
+            type(self).run_node is TopologicalHandler.run_node
+            and type(self).finish is TopologicalHandler.finish
+        )
+
 
 class H5Handler(TopologicalHandler):
     """H5 Handler, saves all calculation values to a h5 file
 
-    :param str fname: h5 file name
+    :param str fname: h5 file name, or a file-like object (for example
+        ``io.BytesIO`` for an in-memory file)
     :param str gname: group name for the data entry
     """
 
@@ -196,3 +378,79 @@ class H5Handler(TopologicalHandler):
 
     def __init__(self, graph, returns, fname: str, gname: str = ""):
         super().__init__(graph, returns, fname=fname, gname=gname)
+
+
+class MemoHandler(TopologicalHandler):
+    """Memoized handler, reuse node outputs for repeated node inputs
+
+    The node outputs are stored with the node inputs as the key. If a node is
+    executed with identical inputs, the stored output is returned instead.
+    The node objects are required to be pure functions. Numpy arrays are
+    compared by the dtype, shape and bytes, the inputs with other unhashable
+    values are not memoized.
+
+    :param int maxsize: maximum number of stored node outputs, the least
+        recently used outputs are discarded
+    """
+
+    DataClass = dict
+
+    def __init__(self, graph, returns: list = [], maxsize: int = 1024):
+
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        super().__init__(graph, returns)
+
+    def node_callable(self, node, func):
+        """Wrap the node object with the memoization lookup"""
+
+        cache = self.cache
+
+        def memo_wrapped(**kwargs):
+            try:
+                key = (node, tuple(_memo_key(value) for value in kwargs.values()))
+            except TypeError:  # unhashable input
+                return func(**kwargs)
+
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+            output = func(**kwargs)
+            cache[key] = output
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+
+            return output
+
+        return memo_wrapped
+
+
+def _memo_key(value):
+    """Key of the value for memoization
+
+    The type is included so that equal values of different types
+    (1 and 1.0) are not treated as identical. Floats and numpy values are
+    keyed by their bits (0.0 and -0.0 are different), and tuples are keyed
+    by the keys of their items.
+    """
+
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "O":
+            raise TypeError("object arrays are not memoized")
+        return np.ndarray, value.dtype.str, value.shape, value.tobytes()
+
+    if isinstance(value, np.generic):
+        return type(value), value.tobytes()
+
+    if isinstance(value, float):
+        return type(value), value.hex()
+
+    if isinstance(value, complex):
+        return type(value), value.real.hex(), value.imag.hex()
+
+    if isinstance(value, tuple):
+        return type(value), tuple(_memo_key(item) for item in value)
+
+    hash(value)  # raises TypeError for unhashable values
+    return type(value), value
@@ -1,7 +1,6 @@
 import inspect
 from mmodel.utility import (
-    parse_input,
-    is_node_attr_defined,
+    input_parser,
     is_edge_attr_defined,
     model_returns,
 )
@@ -37,7 +36,10 @@ class Model:
         # used by the handler
         # modify self.graph does not change the model itself
         # self.graph = nx.freeze(graph.deepcopy())
-        self.graph = nx.freeze(graph)
+        # a graph shared by several models is only frozen once
+        if not nx.is_frozen(graph):
+            nx.freeze(graph)
+        self.graph = graph
         self.modifiers = modifiers or list()
         self.handler = handler
         self.description = description
@@ -51,13 +53,27 @@ class Model:
 
         self.__signature__ = executor.__signature__
         self.returns = executor.returns
+        self._parse_input = input_parser(self.__signature__)
         # final callable
         self.executor = executor
 
+    def __getstate__(self):
+        """The input parser is local to the instance, it is not pickled"""
+
+        state = self.__dict__.copy()
+        del state["_parse_input"]
+        return state
+
+    def __setstate__(self, state):
+        """Create the input parser again after unpickling"""
+
+        self.__dict__.update(state)
+        self._parse_input = input_parser(self.__signature__)
+
     def __call__(self, *args, **kwargs):
 
         # process inputs
-        inputs = parse_input(self.__signature__, *args, **kwargs)
+        inputs = self._parse_input(*args, **kwargs)
 
         return self.executor(**inputs)
 
@@ -92,19 +108,31 @@ class Model:
         """
 
         assert nx.is_directed(G), "invalid graph: undirected graph"
-        assert not nx.recursive_simple_cycles(G), "invalid graph: graph contains cycles"
-        assert not list(nx.isolates(G)), "invalid graph: graph contains isolated nodes"
-
-        assert is_node_attr_defined(
-            G, "func"
+        # single topological sort pass instead of enumerating the cycles
+        assert nx.is_directed_acyclic_graph(G), "invalid graph: graph contains cycles"
+
+        # single pass over the nodes for isolated nodes and node attributes
+        # the assertions below keep the order of the checks
+        isolated = False
+        missing_attrs = set()
+        for node, node_dict in G.nodes(data=True):
+            isolated = isolated or G.degree(node) == 0
+            missing_attrs.update(
+                attr for attr in ["func", "returns", "sig"] if attr not in node_dict
+            )
+
+        assert not isolated, "invalid graph: graph contains isolated nodes"
+
+        assert (
+            "func" not in missing_attrs
         ), "invalid graph: graph contains nodes with undefined callables"
 
         # the following might occur when the node object is incorrectly constructed
-        assert is_node_attr_defined(G, "returns"), (
+        assert "returns" not in missing_attrs, (
             "invalid graph: graph contains nodes with undefined callables returns, "
             "recommend using ModelGraph set_node_object method to add node object"
         )
-        assert is_node_attr_defined(G, "sig"), (
+        assert "sig" not in missing_attrs, (
             "invalid graph: graph contains nodes with undefined callables signatures, "
             "recommend using ModelGraph set_node_object method to add node object"
         )
@@ -1,19 +1,35 @@
 from functools import wraps
 import inspect
-from mmodel.utility import parse_input
+import numpy as np
+from mmodel.utility import input_parser, _cached_signature
 
 
-def loop_modifier(func, parameter: str):
+def loop_modifier(func, parameter: str, vectorize: bool = False):
     """Loop - iterates one given parameter
 
     :param list parameter: target parameter to loop
+    :param bool vectorize: if the loop values are a numpy array, the array
+        is passed to the function in a single call, and the function output
+        is returned. The function needs to support array inputs (broadcast).
+        Defaults to False.
     """
 
     @wraps(func)
     def loop_wrapped(**kwargs):
 
         loop_values = kwargs.pop(parameter)
-        return [func(**kwargs, **{parameter: value}) for value in loop_values]
+
+        if vectorize and isinstance(loop_values, np.ndarray):
+            kwargs[parameter] = loop_values
+            return func(**kwargs)
+
+        result = []
+        for value in loop_values:
+            # kwargs is local to the wrapper, update the loop value in place
+            kwargs[parameter] = value
+            result.append(func(**kwargs))
+
+        return result
 
     return loop_wrapped
 
@@ -34,9 +50,9 @@ def zip_loop_modifier(func, parameters: list):
         result = []
         for value in zip(*loop_values):  # unzip the values
 
-            loop_value_dict = dict(zip(parameters, value))
-            rv = func(**kwargs, **loop_value_dict)
-            result.append(rv)
+            # kwargs is local to the wrapper, update the loop values in place
+            kwargs.update(zip(parameters, value))
+            result.append(func(**kwargs))
 
         return result
 
@@ -66,7 +82,7 @@ def signature_modifier(func, parameters):
     """
     sig = inspect.Signature([inspect.Parameter(var, 1) for var in parameters])
 
-    old_parameters = list(inspect.signature(func).parameters.keys())
+    old_parameters = list(_cached_signature(func).parameters.keys())
 
     if len(parameters) > len(old_parameters):
         raise Exception(
@@ -95,18 +111,17 @@ def signature_binding_modifier(func):
     that do not have a parameter binding step (ones that only allow
     keyword arguments).
 
-    The parse_input method binds the input args and kwargs and fills
+    The input parser binds the input args and kwargs and fills
     default values automatically. The resulting function behaves the
-    same as a python function.
+    same as a python function. The parser is created once for the
+    signature, see ``input_parser``.
     """
 
-    sig = inspect.signature(func)
+    parser = input_parser(_cached_signature(func))
 
     @wraps(func)
     def wrapped(*args, **kwargs):
 
-        parsed_kwargs = parse_input(sig, *args, **kwargs)
-
-        return func(**parsed_kwargs)
+        return func(**parser(*args, **kwargs))
 
     return wrapped
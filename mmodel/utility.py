@@ -1,5 +1,7 @@
 import inspect
 import networkx as nx
+from collections import Counter
+from weakref import WeakKeyDictionary
 
 
 def param_sorter(parameter):
@@ -20,6 +22,34 @@ def param_sorter(parameter):
         return parameter.kind, False, parameter.name
 
 
+# cached signatures, the callables are weakly referenced so that the cache
+# does not keep the callables (and the objects they close over) alive
+_signature_cache = WeakKeyDictionary()
+
+
+def _cached_signature(func):
+    """Obtain the signature of the callable
+
+    Callables that carry the ``__signature__`` attribute (modifier outputs,
+    models and handlers) return the attribute directly. Otherwise, the result
+    of ``inspect.signature`` is cached. Callables that are unhashable or
+    cannot be weakly referenced are not cached.
+    """
+
+    sig = getattr(func, "__signature__", None)
+    if isinstance(sig, inspect.Signature):
+        return sig
+
+    try:
+        sig = _signature_cache.get(func)
+    except TypeError:
+        return inspect.signature(func)
+
+    if sig is None:
+        sig = _signature_cache[func] = inspect.signature(func)
+    return sig
+
+
 def model_signature(graph):
     """Obtain the signature from the model graph
 
@@ -30,18 +60,23 @@ def model_signature(graph):
     """
 
     parameters = {}
+    sort_keys = {}  # param_sorter is called once for each parameter
     for sig in nx.get_node_attributes(graph, "sig").values():
         for pname, param in sig.parameters.items():
-            if pname in parameters:
-                if param_sorter(parameters[pname]) >= param_sorter(param):
-                    continue
-            parameters.update({pname: param})
+            key = param_sorter(param)
+            if pname not in sort_keys or sort_keys[pname] < key:
+                parameters[pname] = param
+                sort_keys[pname] = key
 
+    all_returns = set()
     for returns in nx.get_node_attributes(graph, "returns").values():
-        for rt in returns:
-            parameters.pop(rt, None)  # if doesn't exist return None
+        all_returns.update(returns)
 
-    return inspect.Signature(sorted(parameters.values(), key=param_sorter))
+    pnames = sorted(
+        (pname for pname in parameters if pname not in all_returns),
+        key=sort_keys.__getitem__,
+    )
+    return inspect.Signature([parameters[pname] for pname in pnames])
 
 
 def model_returns(graph):
@@ -51,17 +86,15 @@ def model_returns(graph):
     The function checks all returns value and all intermediate value (edge values)
     """
 
-    returns = []
-    intermediate = []
+    returns = set()
+    intermediate = set()
 
-    for node in graph.nodes():
-        returns.extend(graph.nodes[node]["returns"])
-    for edge in graph.edges():
-        intermediate.extend(graph.edges[edge]['val'])
+    for _, rts in graph.nodes(data="returns"):
+        returns.update(rts)
+    for _, _, val in graph.edges(data="val"):
+        intermediate.update(val)
 
-    final_returns = list(set(returns) - set(intermediate))
-    final_returns.sort()
-    return final_returns
+    return sorted(returns - intermediate)
 
 
 def replace_signature(signature, replacement_dict):
@@ -95,12 +128,9 @@ def graph_topological_sort(graph):
 
     """
 
-    topological_order = []
-
-    for node in nx.topological_sort(graph):
-        topological_order.append((node, graph.nodes[node]))
-
-    return topological_order
+    # the node attribute dictionaries are accessed directly, skip the NodeView
+    node_data = graph._node
+    return [(node, node_data[node]) for node in nx.topological_sort(graph)]
 
 
 def param_counter(graph, returns):
@@ -114,18 +144,14 @@ def param_counter(graph, returns):
     :rtype: dict
     """
 
-    value_list = []
+    count = Counter()
     for sig in nx.get_node_attributes(graph, "sig").values():
-        value_list.extend(sig.parameters.keys())
-
-    # add the additional parameter to list
-    value_list += returns
+        count.update(sig.parameters.keys())
 
-    count = {}
-    for value in value_list:
-        count[value] = count.get(value, 0) + 1
+    # add the additional parameter to the count
+    count.update(returns)
 
-    return count
+    return dict(count)
 
 
 def modify_subgraph(
@@ -203,21 +229,71 @@ def parse_input(signature, *args, **kwargs):
     return values.arguments
 
 
+def input_parser(signature):
+    """Create the input parser of the signature
+
+    The parser binds the input args and kwargs and fills the default values,
+    the same as ``parse_input``. A function with the same parameters is
+    compiled, so that the arguments are bound by the interpreter instead of
+    ``Signature.bind``. If the binding fails, ``parse_input`` is used to raise
+    the binding error. Signatures with variable parameters (``*args``,
+    ``**kwargs``) use ``parse_input`` directly.
+    """
+
+    params = list(signature.parameters.values())
+    var_kinds = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+    if any(param.kind in var_kinds for param in params):
+        return lambda *args, **kwargs: parse_input(signature, *args, **kwargs)
+
+    namespace = {}
+    arg_list = []
+    for i, param in enumerate(params):
+        if param.kind is param.KEYWORD_ONLY and "*" not in arg_list:
+            arg_list.append("*")
+        if param.default is param.empty:
+            arg_list.append(param.name)
+        else:
+            namespace[f"_d{i}"] = param.default
+            arg_list.append(f"{param.name}=_d{i}")
+        if param.kind is param.POSITIONAL_ONLY and (
+            i + 1 == len(params) or params[i + 1].kind is not param.POSITIONAL_ONLY
+        ):
+            arg_list.append("/")
+
+    values = ", ".join(f"{param.name!r}: {param.name}" for param in params)
+    source = f"def _bind({', '.join(arg_list)}):\n    return {{{values}}}"
+    exec(compile(source, "<mmodel>", "exec"), namespace)
+    bind = namespace["_bind"]
+
+    def parser(*args, **kwargs):
+        try:
+            return bind(*args, **kwargs)
+        except TypeError:
+            # raise the same exception as Signature.bind
+            parse_input(signature, *args, **kwargs)
+            raise
+
+    return parser
+
+
 def is_node_attr_defined(graph, attr: str):
     """Check if all graph nodes have the target attribute defined
 
-    Use ``set`` to ignore the order. Returns true if all nodes have the target
-    attribute
+    The check stops at the first node without the attribute. Returns true if
+    all nodes have the target attribute
     """
 
-    return set(nx.get_node_attributes(graph, attr).keys()) == set(graph.nodes)
+    node_data = graph._node
+    return all(attr in node_data[node] for node in node_data)
 
 
 def is_edge_attr_defined(graph, attr: str):
     """Check if all graph edges have the target attribute defined
 
-    Use ``set`` to ignore the order. Returns true if all nodes have the target
-    attribute
+    The check stops at the first edge without the attribute. Returns true if
+    all edges have the target attribute
     """
 
-    return set(nx.get_edge_attributes(graph, attr).keys()) == set(graph.edges)
+    adj = graph._adj
+    return all(attr in adj[u][v] for u, v in graph.edges)
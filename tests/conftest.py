@@ -3,8 +3,11 @@
 The configuration file provides several default graph fixtures
 and test functions
 
-1. `standard_G` - test graph generated using DiGraph, scope: function
-2. `mmodel_G` - test graph generated using ModelGraph. scope: function
+1. `standard_G` - test graph generated using DiGraph, scope: session
+2. `mmodel_G` - test graph generated using ModelGraph. scope: session
+
+The graph fixtures are shared by all tests, tests that modify the graph
+should modify a (deep) copy of the graph.
 """
 
 
@@ -13,10 +16,59 @@ from inspect import signature, Signature, Parameter
 import networkx as nx
 from mmodel.graph import ModelGraph
 import math
-from networkx.utils import nodes_equal, edges_equal
+from networkx.utils import nodes_equal
+
+
+def addition(a, b=2):
+    return a + b
+
+
+def subtraction(c, d):
+    return c - d
+
+
+def polynomial(c, f):
+    return c**f, f**c
+
+
+def multiplication(e, g):
+    return e * g
 
 
-@pytest.fixture()
+def logarithm(c, b):
+    return math.log(c, b)
+
+
+# the node functions are shared by standard_G and mmodel_G,
+# inspect the signatures once at import
+_SIG = {
+    func: signature(func)
+    for func in (addition, subtraction, polynomial, multiplication, logarithm)
+}
+
+
+# node and edge data of standard_G, networkx copies the attribute dictionaries
+_NODE_LIST = (
+    ("add", {"func": addition, "returns": ["c"], "sig": _SIG[addition]}),
+    ("subtract", {"func": subtraction, "returns": ["e"], "sig": _SIG[subtraction]}),
+    ("poly", {"func": polynomial, "returns": ["g", "p"], "sig": _SIG[polynomial]}),
+    (
+        "multiply",
+        {"func": multiplication, "returns": ["k"], "sig": _SIG[multiplication]},
+    ),
+    ("log", {"func": logarithm, "returns": ["m"], "sig": _SIG[logarithm]}),
+)
+
+_EDGE_LIST = (
+    ("add", "subtract", {"val": ["c"]}),
+    ("subtract", "multiply", {"val": ["e"]}),
+    ("add", "poly", {"val": ["c"]}),
+    ("poly", "multiply", {"val": ["g"]}),
+    ("add", "log", {"val": ["c"]}),
+)
+
+
+@pytest.fixture(scope="session")
 def standard_G():
     """Standard test graph generated using DiGraph
 
@@ -26,60 +78,16 @@ def standard_G():
     p = f^(a + b)
     """
 
-    def addition(a, b=2):
-        return a + b
-
-    def subtraction(c, d):
-        return c - d
-
-    def polynomial(c, f):
-        return c**f, f**c
-
-    def multiplication(e, g):
-        return e * g
-
-    def logarithm(c, b):
-        return math.log(c, b)
-
-    node_list = [
-        ("add", {"func": addition, "returns": ["c"], "sig": signature(addition)}),
-        (
-            "subtract",
-            {"func": subtraction, "returns": ["e"], "sig": signature(subtraction)},
-        ),
-        (
-            "poly",
-            {"func": polynomial, "returns": ["g", "p"], "sig": signature(polynomial)},
-        ),
-        (
-            "multiply",
-            {
-                "func": multiplication,
-                "returns": ["k"],
-                "sig": signature(multiplication),
-            },
-        ),
-        ("log", {"func": logarithm, "returns": ["m"], "sig": signature(logarithm)}),
-    ]
-
-    edge_list = [
-        ("add", "subtract", {"val": ["c"]}),
-        ("subtract", "multiply", {"val": ["e"]}),
-        ("add", "poly", {"val": ["c"]}),
-        ("poly", "multiply", {"val": ["g"]}),
-        ("add", "log", {"val": ["c"]}),
-    ]
-
     G = nx.DiGraph(name="test graph")
     G.graph["type"] = "ModelGraph"  # for comparison
 
-    G.add_nodes_from(node_list)
-    G.add_edges_from(edge_list)
+    G.add_nodes_from(_NODE_LIST)
+    G.add_edges_from(_EDGE_LIST)
 
     return G
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mmodel_G():
     """Mock test graph generated using ModelGraph
 
@@ -89,21 +97,6 @@ def mmodel_G():
     p = f^(a + b)
     """
 
-    def addition(a, b=2):
-        return a + b
-
-    def subtraction(c, d):
-        return c - d
-
-    def polynomial(c, f):
-        return c**f, f**c
-
-    def multiplication(e, g):
-        return e * g
-
-    def logarithm(c, b):
-        return math.log(c, b)
-
     grouped_edges = [
         ("add", ["subtract", "poly", "log"]),
         (["subtract", "poly"], "multiply"),
@@ -123,27 +116,34 @@ def mmodel_G():
     return G
 
 
-@pytest.fixture(scope="module")
-def mmodel_signature():
-    """The default signature of the mmodel_G models"""
-
-    param_list = [
+_MMODEL_SIGNATURE = Signature(
+    [
         Parameter("a", 1),
         Parameter("d", 1),
         Parameter("f", 1),
         Parameter("b", 1, default=2),
     ]
+)
 
-    return Signature(param_list)
+
+@pytest.fixture(scope="session")
+def mmodel_signature():
+    """The default signature of the mmodel_G models
+
+    Signature objects are immutable, the constant is shared.
+    """
+
+    return _MMODEL_SIGNATURE
 
 
 def graph_equal(G1, G2):
-    """Test if graphs have the same nodes, edges and attributes"""
+    """Test if graphs have the same nodes, edges and attributes
 
-    assert nodes_equal(G1._node, G2._node)
-    assert edges_equal(G1._adj, G2._adj)
+    The node attributes are not compared. For DiGraph, the successors
+    determine the predecessors, only the successors are compared.
+    """
 
-    assert G1._pred == G2._pred
+    assert nodes_equal(G1._node, G2._node)
     assert G1._succ == G2._succ
 
     # test graph attributes
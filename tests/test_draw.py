@@ -26,6 +26,17 @@ a -> b [xlabel=""]
 }"""
 
 
+def _norm(source):
+    """Remove the line breaks and indentations of the dot source"""
+
+    return source.replace("\n", "").replace("\t", "")
+
+
+# normalized expected sources
+_DOT_SOURCE_N = _norm(dot_source)
+_PLAIN_DOT_SOURCE_N = _norm(plain_dot_source)
+
+
 def test_update_settings():
     """Test the update_settings function"""
 
@@ -40,9 +51,7 @@ def test_draw_plain_model(mmodel_G):
     """Test the model without the node detail"""
 
     dot_graph = draw_plain_graph(mmodel_G, label="test label")
-    assert dot_graph.source.replace("\n", "").replace("\t", "") == dot_source.replace(
-        "\n", ""
-    )
+    assert _norm(dot_graph.source) == _DOT_SOURCE_N
 
 
 def test_draw_graph(mmodel_G):
@@ -62,6 +71,4 @@ def test_draw_partial_graph():
 
     dot_graph = draw_graph(G, label="test label")
 
-    assert dot_graph.source.replace("\n", "").replace(
-        "\t", ""
-    ) == plain_dot_source.replace("\n", "")
+    assert _norm(dot_graph.source) == _PLAIN_DOT_SOURCE_N
@@ -159,6 +159,25 @@ class TestSetNodeObject:
         assert base_G.edges["func_a", "func_b"] == {"val": ["o", "p"]}
         assert base_G.edges["func_a", "func_c"] == {"val": ["o"]}
 
+    def test_update_graph_nodes(self, base_G):
+        """Test update_graph only updates the edges adjacent to the nodes"""
+
+        def func_b(o, p):
+            return o + p
+
+        def func_c(o, s):
+            return o + s
+
+        base_G.nodes["func_b"].update(func=func_b, returns=["q"], sig=signature(func_b))
+        base_G.nodes["func_c"].update(func=func_c, returns=["t"], sig=signature(func_c))
+
+        base_G.update_graph(["func_b"])
+        assert base_G.edges["func_a", "func_b"] == {"val": ["o", "p"]}
+        assert base_G.edges["func_a", "func_c"] == {}
+
+        base_G.update_graph()
+        assert base_G.edges["func_a", "func_c"] == {"val": ["o"]}
+
 
 # --- Test mmodel_G ---
 class TestModelGraphBasics:
@@ -195,8 +214,9 @@ class TestModelGraphBasics:
         def modifier(func, value):
             return func
 
-        mmodel_G.add_node("test_node")
-        mmodel_G.set_node_object(
+        G = mmodel_G.deepcopy()
+        G.add_node("test_node")
+        G.set_node_object(
             "test_node",
             func,
             ["c"],
@@ -206,7 +226,7 @@ class TestModelGraphBasics:
 
         assert (
             "modifiers: [modifier, {'value': 1}, modifier, {'value': 2}]"
-            in mmodel_G.view_node("test_node")
+            in G.view_node("test_node")
         )
 
     def test_draw(self, mmodel_G):
@@ -243,6 +263,18 @@ class TestGraphOperation:
 
         assert G_copy.graph is not G_deepcopy.graph
 
+    def test_deepcopy_attributes(self, mmodel_G):
+        """Test if deepcopy copies the attribute lists and shares the callables"""
+
+        G_deepcopy = mmodel_G.deepcopy()
+
+        G_deepcopy.nodes["add"]["returns"].append("x")
+        G_deepcopy.edges["add", "log"]["val"].append("x")
+        assert mmodel_G.nodes["add"]["returns"] == ["c"]
+        assert mmodel_G.edges["add", "log"]["val"] == ["c"]
+
+        assert G_deepcopy.nodes["add"]["func"] is mmodel_G.nodes["add"]["func"]
+
     def test_graph_chain(self, mmodel_G):
         """Test Chain graph"""
 
@@ -9,15 +9,40 @@ The test strategy works as the following:
 """
 
 
-from mmodel.handler import MemData, H5Data, MemHandler, BasicHandler, H5Handler
+from mmodel.handler import (
+    MemData,
+    H5Data,
+    MemHandler,
+    BasicHandler,
+    H5Handler,
+    MemoHandler,
+)
+from mmodel import ModelGraph
 import pytest
 import math
+import pickle
 import h5py
 import numpy as np
 import re
+import weakref
 from textwrap import dedent
 
 
+# expected node exception message, dedented once at import
+_EXCEPTION_PATTERN = dedent(
+    """\
+    Exception occurred for node 'log':
+    --- node info ---
+    log
+      callable: logarithm\\(c, b\\)
+      returns: m
+      modifiers: \\[\\]
+    --- input info ---
+    c = 0
+    b = 2"""
+)
+
+
 class TestMemData:
     """Test MemData class"""
 
@@ -122,6 +147,31 @@ class Test_H5Data:
         data["object"] = func
         assert f[data.gname].attrs["object"] == str(func)
 
+    def test_write_object_array(self, data, h5_filename):
+        """Test writing object dtype array is written as attributes"""
+
+        value = np.array([1, "a", None], dtype=object)
+
+        f = h5py.File(h5_filename)
+        data["object"] = value
+        assert f[data.gname].attrs["object"] == str(value)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            np.array(["a", "b"]),
+            np.str_("x"),
+            np.datetime64("2022-10-03"),
+            2**70,
+        ],
+    )
+    def test_write_unsupported_type(self, value, data, h5_filename):
+        """Test values without native HDF5 types are written as attributes"""
+
+        f = h5py.File(h5_filename)
+        data["value"] = value
+        assert f[data.gname].attrs["value"] == str(value)
+
     @pytest.mark.parametrize("scalar, value", [("float", 1.14), ("str", b"test")])
     def test_read_scalar(self, scalar, value, data, h5_filename):
         """Test _read method reading attr data from h5 file"""
@@ -143,6 +193,11 @@ class Test_H5Data:
 
         assert all(data[dataset] == value)
 
+    def test_slots(self, data):
+        """Test that the instance does not allocate an attribute dictionary"""
+
+        assert not hasattr(data, "__dict__")
+
     def test_close(self, data):
         """Test that the h5 file is closed"""
 
@@ -162,18 +217,7 @@ class HandlerTester:
     def test_node_exception(self, handler_instance):
         """Test when node exception a custom exception is outputted"""
 
-        exception_pattern = """\
-        Exception occurred for node 'log':
-        --- node info ---
-        log
-          callable: logarithm\\(c, b\\)
-          returns: m
-          modifiers: \\[\\]
-        --- input info ---
-        c = 0
-        b = 2"""
-
-        with pytest.raises(Exception, match=dedent(exception_pattern)):
+        with pytest.raises(Exception, match=_EXCEPTION_PATTERN):
             handler_instance(a=-2, d=15, f=1, b=2)
 
     def test_intermediate_returns(self, handler_instance_mod):
@@ -198,6 +242,56 @@ class TestBasicHandler(HandlerTester):
         """Create handler instance for the test with the intermediate value for returns"""
         return BasicHandler(mmodel_G, ["c"])
 
+    def test_pickle(self, mmodel_G):
+        """Test the handler round-trips through pickle"""
+
+        handler = pickle.loads(pickle.dumps(BasicHandler(mmodel_G, ["k", "m", "p"])))
+
+        assert handler._run is not None  # compiled again
+        assert handler(a=10, d=15, f=0, b=2) == (-3, math.log(12, 2), 0)
+
+    def test_run_node_override(self, mmodel_G):
+        """Test the run_node method of a subclass is used for execution"""
+
+        class RecordHandler(BasicHandler):
+            def run_node(self, data, node, node_attr):
+                self.executed.append(node)
+                super().run_node(data, node, node_attr)
+
+        handler = RecordHandler(mmodel_G, ["k", "m", "p"])
+        handler.executed = []
+
+        assert handler(a=10, d=15, f=0, b=2) == (-3, math.log(12, 2), 0)
+        assert handler.executed == [node for node, _ in handler.order]
+
+    def test_finish_override(self, mmodel_G):
+        """Test the finish method of a subclass is used for execution"""
+
+        class DictHandler(BasicHandler):
+            def finish(self, data, returns):
+                return {rt: data[rt] for rt in returns}
+
+        handler = DictHandler(mmodel_G, ["k", "p"])
+
+        assert handler(a=10, d=15, f=0, b=2) == {"k": -3, "p": 0}
+
+    def test_multiple_returns_truncated(self):
+        """Test extra node outputs are ignored, the same as the generic loop"""
+
+        def split(a):
+            return np.array([a, a + 1, a + 2])
+
+        G = ModelGraph()
+        G.add_node("split")
+        G.set_node_object("split", split, ["s", "d"])
+
+        class LoopHandler(BasicHandler):
+            def finish(self, data, returns):
+                return super().finish(data, returns)
+
+        assert BasicHandler(G, ["s", "d"])(a=1) == (1, 2)
+        assert LoopHandler(G, ["s", "d"])(a=1) == (1, 2)
+
 
 class TestMemHandler(HandlerTester):
     """Test class Model"""
@@ -212,6 +306,135 @@ class TestMemHandler(HandlerTester):
         """Create handler instance for the test with the intermediate value for returns"""
         return MemHandler(mmodel_G, ["c"])
 
+    def test_pickle(self, mmodel_G):
+        """Test the handler round-trips through pickle"""
+
+        handler = pickle.loads(pickle.dumps(MemHandler(mmodel_G, ["k", "m", "p"])))
+
+        assert handler(a=10, d=15, f=0, b=2) == (-3, math.log(12, 2), 0)
+
+    def test_release_values(self):
+        """Test the intermediate values are released after their last use
+
+        The "check" node runs after the last use of "o", the weak reference
+        to "o" is dead for MemHandler (including subclasses that use the
+        generic loop) but not for BasicHandler.
+        """
+
+        class Value:
+            pass
+
+        refs = []
+
+        def make(x):
+            value = Value()
+            refs.append(weakref.ref(value))
+            return value
+
+        def use(o):
+            return 1
+
+        def check(y):
+            return refs[-1]() is None
+
+        G = ModelGraph()
+        G.add_edges_from([("make", "use"), ("use", "check")])
+        G.set_node_objects_from(
+            [("make", make, ["o"]), ("use", use, ["y"]), ("check", check, ["z"])]
+        )
+
+        class RunNodeHandler(MemHandler):
+            def run_node(self, data, node, node_attr):
+                super().run_node(data, node, node_attr)
+
+        assert MemHandler(G, ["z"])(x=1)
+        assert RunNodeHandler(G, ["z"])(x=1)
+        assert not BasicHandler(G, ["z"])(x=1)
+
+
+class TestMemoHandler(HandlerTester):
+    """Test class MemoHandler"""
+
+    @pytest.fixture
+    def handler_instance(self, mmodel_G):
+        """Create handler instance for the test"""
+        return MemoHandler(mmodel_G, ["k", "m", "p"])
+
+    @pytest.fixture
+    def handler_instance_mod(self, mmodel_G):
+        """Create handler instance for the test with the intermediate value for returns"""
+        return MemoHandler(mmodel_G, ["c"])
+
+    def test_memoization(self, handler_instance):
+        """Test the node outputs are stored and reused
+
+        The second run only changes "d", the outputs of "add", "poly" and "log"
+        are reused.
+        """
+
+        assert handler_instance(a=10, d=15, f=1, b=2) == (-36, math.log(12, 2), 1)
+        assert len(handler_instance.cache) == 5
+
+        assert handler_instance(a=10, d=14, f=1, b=2) == (-24, math.log(12, 2), 1)
+        assert len(handler_instance.cache) == 7
+
+    def test_memoization_maxsize(self, mmodel_G):
+        """Test the least recently used outputs are discarded"""
+
+        handler = MemoHandler(mmodel_G, ["k", "m", "p"], maxsize=3)
+        handler(a=10, d=15, f=1, b=2)
+
+        assert len(handler.cache) == 3
+        # the last executed node is multiply
+        assert list(handler.cache)[-1][0] == "multiply"
+
+    def test_memoization_inputs(self, handler_instance):
+        """Test the memoization keys of different node inputs
+
+        Numpy arrays are memoized by value, values of different types are
+        not identical, and unhashable inputs are always executed.
+        """
+
+        calls = []
+
+        def func(x):
+            calls.append(x)
+            return 1
+
+        memo_func = handler_instance.node_callable("test", func)
+
+        memo_func(x=np.array([1, 2]))
+        memo_func(x=np.array([1, 2]))
+        assert len(calls) == 1
+
+        memo_func(x=1)
+        memo_func(x=1.0)
+        assert len(calls) == 3
+
+        memo_func(x=[1, 2])
+        memo_func(x=[1, 2])
+        assert len(calls) == 5
+
+        memo_func(x=(1, 2))
+        memo_func(x=(1, 2.0))
+        assert len(calls) == 7
+
+    def test_memoization_signed_zero(self):
+        """Test 0.0 and -0.0 are not identical inputs"""
+
+        def sign(x):
+            return math.copysign(1, x)
+
+        G = ModelGraph()
+        G.add_node("sign")
+        G.set_node_object("sign", sign, ["s"])
+        handler = MemoHandler(G, ["s"])
+
+        assert handler(x=0.0) == 1
+        assert handler(x=-0.0) == -1
+        assert handler(x=np.float32(0.0)) == 1
+        assert handler(x=np.float32(-0.0)) == -1
+
 
 class TestH5Handler(HandlerTester):
     """Test class Model
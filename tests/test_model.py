@@ -1,25 +1,72 @@
 import inspect
+import io
 import pytest
 from mmodel.model import Model
 from mmodel.handler import BasicHandler, H5Handler
 from mmodel.modifier import loop_modifier
 import math
+import pickle
 import networkx as nx
-from copy import deepcopy
 from textwrap import dedent
 
+# expected string representations, dedented once at import
+_MODEL_STR = dedent(
+    """\
+    model_instance(a, d, f, b=2)
+      returns: k, m, p
+      handler: BasicHandler, {}
+      modifiers: []
+    example model"""
+)
+
+_MOD_MODEL_STR = dedent(
+    """\
+    mod_model_instance(a, d, f, b=2)
+      returns: k, m, p
+      handler: BasicHandler, {}
+      modifiers: [loop_modifier, {'parameter': 'a'}]
+    modified model"""
+)
+
+_NODE_S = dedent(
+    """\
+    log
+      callable: logarithm(c, b)
+      returns: m
+      modifiers: []"""
+)
+
+
+@pytest.fixture(scope="module")
+def model_instance(mmodel_G):
+    """Construct a model_instance
+
+    The model is not modified by the tests, it is shared in the module.
+    """
+
+    return Model(
+        "model_instance", mmodel_G, (BasicHandler, {}), description="example model"
+    )
+
+
+@pytest.fixture(scope="module")
+def mod_model_instance(mmodel_G):
+    """Construct a model_instance with loop modifier"""
+
+    loop_mod = (loop_modifier, {"parameter": "a"})
+
+    return Model(
+        "mod_model_instance",
+        mmodel_G,
+        (BasicHandler, {}),
+        modifiers=[loop_mod],
+        description="modified model",
+    )
+
 
 class TestModel:
     """Test Model instances"""
 
-    @pytest.fixture
-    def model_instance(self, mmodel_G):
-        """Construct a model_instance"""
-
-        return Model(
-            "model_instance", mmodel_G, (BasicHandler, {}), description="example model"
-        )
-
     def test_model_attr(self, model_instance, mmodel_signature):
         """Test the model has the correct name, signature, returns"""
 
@@ -31,26 +78,35 @@ class TestModel:
     def test_model_str(self, model_instance):
         """Test model representation"""
 
-        MODEL_STR = """\
-        model_instance(a, d, f, b=2)
-          returns: k, m, p
-          handler: BasicHandler, {}
-          modifiers: []
-        example model"""
-
-        assert str(model_instance) == dedent(MODEL_STR)
+        assert str(model_instance) == _MODEL_STR
 
     def test_model_graph_freeze(self, model_instance):
         """Test the graph is frozen"""
 
         assert nx.is_frozen(model_instance.graph)
 
+    def test_model_frozen_graph(self, model_instance, mmodel_G):
+        """Test a model can be built on an already frozen graph"""
+
+        model = Model("model_frozen", model_instance.graph, (BasicHandler, {}))
+
+        assert model.graph is mmodel_G
+        assert nx.is_frozen(model.graph)
+
     def test_model_execution(self, model_instance):
         """Test if the default is correctly used"""
 
         assert model_instance(10, 15, 1) == (-36, math.log(12, 2), 1)
         assert model_instance(a=1, d=2, f=3, b=4) == (375, math.log(5, 4), 243)
 
+    def test_model_pickle(self, model_instance):
+        """Test the model round-trips through pickle"""
+
+        model = pickle.loads(pickle.dumps(model_instance))
+
+        assert model.__signature__ == model_instance.__signature__
+        assert model(10, 15, 0, 2) == (-3, math.log(12, 2), 0)
+
     def test_get_node(self, model_instance, mmodel_G):
         """Test get_node method of the model"""
 
@@ -74,63 +130,43 @@ class TestModel:
     def test_model_view_node(self, model_instance):
         """Test if view node outputs node information correctly"""
 
-        node_s = """\
-        log
-          callable: logarithm(c, b)
-          returns: m
-          modifiers: []"""
+        assert model_instance.view_node("log") == _NODE_S
 
-        assert model_instance.view_node("log") == dedent(node_s)
+    def test_model_with_handler_argument(self, mmodel_G):
+        """Test if argument works with the H5Handler
 
-    def test_model_with_handler_argument(self, mmodel_G, tmp_path):
-        """Test if argument works with the H5Handler"""
+        The h5 file is an in-memory file-like object.
+        """
 
-        path = tmp_path / "h5model_test.h5"
-        h5model = Model("h5 model", mmodel_G, (H5Handler, {"fname": path}))
+        fobj = io.BytesIO()
+        h5model = Model("h5 model", mmodel_G, (H5Handler, {"fname": fobj}))
 
         assert h5model(a=10, d=15, f=1, b=2) == (-36, math.log(12, 2), 1)
 
-        # the output of path is the repr instead of string
-        assert f"handler: H5Handler, {{'fname': {repr(path)}}}" in str(h5model)
-
-    def test_model_returns(self, mmodel_G):
+        # the output of the file object is the repr instead of string
+        assert f"handler: H5Handler, {{'fname': {repr(fobj)}}}" in str(h5model)
+
+    @pytest.mark.parametrize(
+        "returns, expected",
+        [
+            (["m", "k"], (math.log(12, 2), -36)),  # less returns
+            (["m", "k", "c"], (math.log(12, 2), -36, 12)),  # more returns
+        ],
+    )
+    def test_model_returns(self, mmodel_G, returns, expected):
         """Test model with custom returns
 
         The return order should be the same as the returns list
         """
 
-        # less returns
-        model = Model(
-            "model_instance", mmodel_G, (BasicHandler, {}), returns=["m", "k"]
-        )
-        assert model.returns == ["m", "k"]
-        assert model(a=10, d=15, f=1, b=2) == (math.log(12, 2), -36)
-
-        # more returns
-        model = Model(
-            "model_instance", mmodel_G, (BasicHandler, {}), returns=["m", "k", "c"]
-        )
-        assert model.returns == ["m", "k", "c"]
-        assert model(a=10, d=15, f=1, b=2) == (math.log(12, 2), -36, 12)
+        model = Model("model_instance", mmodel_G, (BasicHandler, {}), returns=returns)
+        assert model.returns == returns
+        assert model(a=10, d=15, f=1, b=2) == expected
 
 
 class TestModifiedModel:
     """Test modified model"""
 
-    @pytest.fixture
-    def mod_model_instance(self, mmodel_G):
-        """Construct a model_instance with loop modifier"""
-
-        loop_mod = (loop_modifier, {"parameter": "a"})
-
-        return Model(
-            "mod_model_instance",
-            mmodel_G,
-            (BasicHandler, {}),
-            modifiers=[loop_mod],
-            description="modified model",
-        )
-
     def test_mod_model_attr(self, mod_model_instance):
         """Test if adding modifier changes the handler attribute (returns)"""
 
@@ -146,62 +182,55 @@ class TestModifiedModel:
 
     def test_model_str(self, mod_model_instance):
         """Test the string representation with modifiers"""
-        mod_model_s = """\
-        mod_model_instance(a, d, f, b=2)
-          returns: k, m, p
-          handler: BasicHandler, {}
-          modifiers: [loop_modifier, {'parameter': 'a'}]
-        modified model"""
-        assert str(mod_model_instance) == dedent(mod_model_s)
+        assert str(mod_model_instance) == _MOD_MODEL_STR
 
 
-class TestModelValidation:
-    """Test is_graph_valid method of Model"""
-
-    def test_is_valid_graph_digraph(self):
-        """Test is_graph_valid that correctly identifies non directed graphs"""
+def _build_cycle():
+    """Graph with cycle 1 -> 2 -> 3 -> 1"""
 
-        g = nx.complete_graph(4)
+    g = nx.DiGraph()
+    g.add_edges_from([[1, 2], [2, 3], [3, 1]])
+    return g
 
-        with pytest.raises(AssertionError, match="invalid graph: undirected graph"):
-            Model._is_valid_graph(g)
 
-    def test_is_valid_graph_cycles(self):
-        """Test is_graph_valid that correctly identifies cycles
+def _build_self_cycle():
+    """Graph with self cycle 1 -> 1"""
 
-        Check a self cycle and a non self cycle
-        """
+    g = nx.DiGraph()
+    g.add_edge(1, 1)
+    return g
 
-        g = nx.DiGraph()
-        g.add_edges_from([[1, 2], [2, 3], [3, 1]])
-        # cycle goes from 1 -> 2 -> 3 -> 1
 
-        with pytest.raises(
-            AssertionError, match="invalid graph: graph contains cycles"
-        ):
-            Model._is_valid_graph(g)
+def _build_isolates():
+    """Graph with isolated node 4"""
 
-        g = nx.DiGraph()
-        g.add_edge(1, 1)
-        # cycle goes from 1 -> 1
+    g = nx.DiGraph()
+    g.add_edges_from([[1, 2], [2, 3]])
+    g.add_node(4)
+    return g
 
-        with pytest.raises(
-            AssertionError, match="invalid graph: graph contains cycles"
-        ):
-            Model._is_valid_graph(g)
 
-    def test_is_valid_graph_isolates(self):
-        """Test is_graph_valid that correctly identifies isolated nodes"""
+class TestModelValidation:
+    """Test is_graph_valid method of Model"""
 
-        g = nx.DiGraph()
-        g.add_edges_from([[1, 2], [2, 3]])
-        g.add_node(4)
-        # 4 is the isolated node
+    @pytest.mark.parametrize(
+        "builder, msg",
+        [
+            (lambda: nx.complete_graph(4), "undirected graph"),
+            (_build_cycle, "graph contains cycles"),
+            (_build_self_cycle, "graph contains cycles"),
+            (_build_isolates, "graph contains isolated nodes"),
+        ],
+    )
+    def test_is_valid_graph_invalid(self, builder, msg):
+        """Test is_graph_valid that correctly identifies invalid graphs
+
+        The graphs are undirected, contain a cycle, a self cycle or
+        an isolated node.
+        """
 
-        with pytest.raises(
-            AssertionError, match="invalid graph: graph contains isolated nodes"
-        ):
-            Model._is_valid_graph(g)
+        with pytest.raises(AssertionError, match=f"invalid graph: {msg}"):
+            Model._is_valid_graph(builder())
 
     def test_is_valid_graph_missing_attr(self, standard_G):
         """Test is_graph_valid that correctly identifies isolated nodes
@@ -212,7 +241,8 @@ class TestModelValidation:
         def test(a, b):
             return
 
-        g = deepcopy(standard_G)
+        # only the new node and edge are modified, a shallow copy is sufficient
+        g = standard_G.copy()
         g.add_edge("log", "test")
 
         with pytest.raises(
@@ -6,6 +6,7 @@ from mmodel.modifier import (
 )
 import pytest
 import inspect
+import numpy as np
 
 
 @pytest.fixture
@@ -25,6 +26,21 @@ def test_loop(example_func):
     assert loop_mod(a=1, b=[1, 2, 3], c=4) == [6, 7, 8]
 
 
+def test_loop_vectorize(example_func):
+    """Test loop modifier with vectorize option
+
+    The numpy array is passed to the function in a single call, other
+    iterables are looped.
+    """
+
+    loop_mod = loop_modifier(example_func, "b", vectorize=True)
+
+    result = loop_mod(a=1, b=np.array([1, 2, 3]), c=4)
+    assert isinstance(result, np.ndarray)
+    assert np.array_equal(result, [6, 7, 8])
+    assert loop_mod(a=1, b=[1, 2, 3], c=4) == [6, 7, 8]
+
+
 def test_zip_loop_list(example_func):
     """Test zip loop modifier with list input"""
 
@@ -33,6 +49,34 @@ def test_zip_loop_list(example_func):
     assert loop_mod(a=[0.1, 0.2, 0.3], b=[1, 2, 3], c=10) == [11.1, 12.2, 13.3]
 
 
+def test_loop_iterator(example_func):
+    """Test loop modifiers with iterators and values of different lengths"""
+
+    loop_mod = loop_modifier(example_func, "b")
+    assert loop_mod(a=1, b=iter([1, 2, 3]), c=4) == [6, 7, 8]
+
+    zip_loop_mod = zip_loop_modifier(example_func, ["a", "b"])
+    assert zip_loop_mod(a=iter([0.1, 0.2]), b=[1, 2, 3], c=10) == [11.1, 12.2]
+
+
+def test_loop_length_mismatch(example_func):
+    """Test loop modifiers only use the iterated values, not the length
+
+    For example, the length of a pandas DataFrame is the number of rows, and
+    the iteration is over the columns.
+    """
+
+    class Values(list):
+        def __len__(self):
+            return 3
+
+    loop_mod = loop_modifier(example_func, "b")
+    assert loop_mod(a=1, b=Values([1, 2]), c=4) == [6, 7]
+
+    zip_loop_mod = zip_loop_modifier(example_func, ["a", "b"])
+    assert zip_loop_mod(a=Values([0.1, 0.2]), b=[1, 2, 3], c=10) == [11.1, 12.2]
+
+
 def test_signature_modifiers(example_func):
     """Test signature_modifier changes signature and executes function correctly
 
@@ -1,6 +1,7 @@
 import inspect
 import pytest
 import random
+import weakref
 import mmodel.utility as util
 from collections import OrderedDict
 from inspect import Parameter
@@ -58,6 +59,46 @@ def test_param_sorter_order(func):
     assert sorted(shuffled_params.values(), key=util.param_sorter) == param_list
 
 
+def test_cached_signature(func):
+    """Test _cached_signature
+
+    The signature attribute is used directly if defined, otherwise
+    the inspected signature is cached.
+    """
+
+    assert util._cached_signature(func) == inspect.signature(func)
+    assert util._cached_signature(func) is util._cached_signature(func)
+
+    sig = inspect.Signature([Parameter("x", 1)])
+    func.__signature__ = sig
+    assert util._cached_signature(func) is sig
+
+
+def test_cached_signature_weak_reference():
+    """Test the signature cache does not keep the callables alive"""
+
+    def func(a, b):
+        return a + b
+
+    ref = weakref.ref(func)
+    assert list(util._cached_signature(func).parameters) == ["a", "b"]
+
+    del func
+    assert ref() is None
+
+    class SlotFunc:
+        """Callable that cannot be weakly referenced"""
+
+        __slots__ = ()
+
+        def __call__(self, x):
+            return x
+
+    # callables that cannot be weakly referenced are not cached
+    slot_func = SlotFunc()
+    assert util._cached_signature(slot_func) == inspect.signature(slot_func)
+
+
 def test_model_signature(mmodel_G, mmodel_signature):
     """Test graph_signature
 
@@ -254,6 +295,34 @@ def test_modify_node(mmodel_G):
     assert mod_G["subtract"]["multiply"]["val"] == ["g"]
 
 
+def test_input_parser():
+    """Test input_parser binds the inputs the same as parse_input"""
+
+    def func(a, b=2, /, c=3, *, d, e=5):
+        return
+
+    sig = inspect.signature(func)
+    parser = util.input_parser(sig)
+
+    assert parser(1, d=4) == util.parse_input(sig, 1, d=4)
+    assert parser(1, 2, c=0, d=4, e=1) == util.parse_input(sig, 1, 2, c=0, d=4, e=1)
+
+    with pytest.raises(TypeError, match="missing a required argument: 'd'"):
+        parser(1)
+
+    with pytest.raises(TypeError, match="got an unexpected keyword argument 'f'"):
+        parser(1, d=4, f=2)
+
+
+def test_input_parser_variable_parameters(func):
+    """Test input_parser with variable parameters"""
+
+    sig = inspect.signature(func)
+    parser = util.input_parser(sig)
+
+    assert parser(1, 2, 3, 4, d=5, f=6) == util.parse_input(sig, 1, 2, 3, 4, d=5, f=6)
+
+
 def test_is_node_attr_defined():
     """Test is_node_attr_defined"""
 